@@ -1,8 +1,10 @@
 ## client.py
 # Basic IRC client implementation.
 import asyncio
+import codecs
+import collections
 import logging
-from asyncio import new_event_loop, gather, get_event_loop, sleep
+from asyncio import new_event_loop, gather, get_event_loop
 import warnings
 from . import connection, protocol
 import inspect
@@ -40,6 +42,11 @@ class BasicClient:
     RECONNECT_DELAYED = True
     RECONNECT_DELAYS = [5, 5, 10, 30, 120, 600]
 
+    # Interned handler prefix and precomputed zero-padded numeric reply names,
+    # shared by all clients so the receive path builds no strings for known commands.
+    _RAW_PREFIX = 'on_raw_'
+    _NUMERIC_COMMANDS = tuple(str(i).zfill(3) for i in range(1000))
+
     @property
     def PING_TIMEOUT(self):
         warnings.warn(
@@ -82,10 +89,14 @@ class BasicClient:
         self.users = {}
 
         # Low-level data stuff.
-        self._receive_buffer = b''
+        self._receive_buffer = bytearray()
+        self._message_pool = collections.deque(maxlen=64)
         self._pending = {}
         self._handler_top_level = False
 
+        # Dispatch cache: command -> (handler, method name).
+        self._raw_dispatch = {}
+
         # Misc.
         self.logger = logging.getLogger(__name__)
 
@@ -97,8 +108,10 @@ class BasicClient:
         """ Reset connection attributes. """
         self.connection = None
         self.encoding = None
+        self._encoder = None
         self._autojoin_channels = []
         self._reconnect_attempts = 0
+        self._server_tag_cache = None
 
     ## Connection.
 
@@ -159,10 +172,15 @@ class BasicClient:
             self.connection = connection.Connection(hostname, port, source_address=source_address,
                                                     eventloop=self.eventloop)
             self.encoding = encoding
+            self._encoder = codecs.getencoder(encoding)
 
         # Connect.
         await self.connection.connect()
 
+    def _reconnect(self):
+        """ Kick off a reconnection attempt as a task on the event loop. """
+        self.eventloop.create_task(self.connect(reconnect=True))
+
     def _reconnect_delay(self):
         """ Calculate reconnection delay. """
         if self.RECONNECT_ON_ERROR and self.RECONNECT_DELAYED:
@@ -179,9 +197,10 @@ class BasicClient:
         }
 
     def _destroy_channel(self, channel):
-        # Copy set to prevent a runtime error when destroying the user.
-        for user in set(self.channels[channel]['users']):
-            self._destroy_user(user, channel)
+        ch = self.channels.get(channel)
+        if ch is None:
+            return
+        self._destroy_users(ch['users'], channel)
         del self.channels[channel]
 
     def _create_user(self, nickname):
@@ -193,9 +212,20 @@ class BasicClient:
             'nickname': nickname,
             'username': None,
             'realname': None,
-            'hostname': None
+            'hostname': None,
+            # Amount of channels we share with this user. Saves us a scan over
+            # every channel when deciding whether to forget about them.
+            '_channels': 0
         }
 
+    def _add_channel_user(self, channel, nickname):
+        """ Add user to a channel's nicklist, keeping their membership count in sync. """
+        users = self.channels[channel]['users']
+        if nickname not in users:
+            users.add(nickname)
+            if nickname in self.users:
+                self.users[nickname]['_channels'] += 1
+
     async def _sync_user(self, nick, metadata):
         # Create user in database.
         if nick not in self.users:
@@ -209,32 +239,58 @@ class BasicClient:
             self.users[new] = self.users[user]
             self.users[new]['nickname'] = new
             del self.users[user]
+            fresh = False
         else:
             await self._create_user(new)
             if new not in self.users:
                 return
+            fresh = True
 
         for ch in self.channels.values():
             # Rename user in channel list.
             if user in ch['users']:
                 ch['users'].discard(user)
                 ch['users'].add(new)
+                if fresh:
+                    # Newly created entry: count the memberships we just discovered.
+                    self.users[new]['_channels'] += 1
 
     def _destroy_user(self, nickname, channel=None):
         if channel:
-            channels = [self.channels[channel]]
+            ch = self.channels.get(channel)
+            channels = [ch] if ch is not None else []
         else:
             channels = self.channels.values()
 
+        user = self.users.get(nickname)
         for ch in channels:
-            # Remove from nicklist.
-            ch['users'].discard(nickname)
+            # Remove from nicklist, keeping the membership count in sync.
+            if nickname in ch['users']:
+                ch['users'].discard(nickname)
+                if user is not None:
+                    user['_channels'] -= 1
 
         # If we're not in any common channels with the user anymore, we have no reliable way to keep their info up-to-date.
         # Remove the user.
-        if not channel or not any(nickname in ch['users'] for ch in self.channels.values()):
+        if not channel or user is None or user['_channels'] <= 0:
             del self.users[nickname]
 
+    def _destroy_users(self, nicknames, channel):
+        """ Batch version of _destroy_user() for tearing down a whole channel at once. """
+        ch = self.channels.get(channel)
+        if ch is None:
+            return
+
+        # Copy to prevent a runtime error when the live user set is passed in.
+        for nickname in list(nicknames):
+            if nickname in ch['users']:
+                ch['users'].discard(nickname)
+                user = self.users.get(nickname)
+                if user is not None:
+                    user['_channels'] -= 1
+                    if user['_channels'] <= 0:
+                        del self.users[nickname]
+
     def _parse_user(self, data):
         """ Parse user and return nickname, metadata tuple. """
         raise NotImplementedError()
@@ -255,7 +311,7 @@ class BasicClient:
 
     def in_channel(self, channel):
         """ Check if we are currently in the given channel. """
-        return channel in self.channels.keys()
+        return channel in self.channels
 
     def is_same_nick(self, left, right):
         """ Check if given nicknames are equal. """
@@ -275,6 +331,14 @@ class BasicClient:
     @property
     def server_tag(self):
         if self.connected and self.connection.hostname:
+            # The network name is only known after registration and the hostname can
+            # change across reconnects, so memoize on both instead of re-parsing the
+            # hostname on every call.
+            key = (self.network, self.connection.hostname)
+            cached = self._server_tag_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
             if self.network:
                 tag = self.network.lower()
             else:
@@ -295,6 +359,7 @@ class BasicClient:
                     except ValueError:
                         tag = host
 
+            self._server_tag_cache = (key, tag)
             return tag
         return None
 
@@ -331,9 +396,9 @@ class BasicClient:
                 else:
                     self.logger.error('Unexpected disconnect. Attempting to reconnect.')
 
-                # Wait and reconnect.
-                await sleep(delay)
-                await self.connect(reconnect=True)
+                # Schedule the reconnect on the event loop rather than sleeping here,
+                # so whoever awaited the disconnect isn't stalled for the whole backoff.
+                self.eventloop.call_later(delay, self._reconnect)
             else:
                 self.logger.error('Unexpected disconnect. Giving up.')
 
@@ -349,11 +414,25 @@ class BasicClient:
     def _parse_message(self):
         raise NotImplementedError()
 
+    def _parse_messages(self):
+        """
+        Drain all complete messages from the receive buffer.
+        Subclasses with a cheaper batched parse can override this; the default
+        falls back to the _has_message()/_parse_message() pair.
+        """
+        while self._has_message():
+            yield self._parse_message()
+
     async def _send(self, input):
-        if not isinstance(input, (bytes, str)):
-            input = str(input)
-        if isinstance(input, str):
-            input = input.encode(self.encoding)
+        # Fast path: raw bytes go out as-is; anything else is stringified and
+        # run through the encoder cached at connect time.
+        if type(input) is not bytes:
+            if type(input) is not str:
+                input = str(input)
+            encoder = self._encoder
+            if encoder is None:
+                encoder = self._encoder = codecs.getencoder(self.encoding)
+            input = encoder(input)[0]
 
         self.logger.debug('>> %s', input.decode(self.encoding))
         await self.connection.send(input)
@@ -383,10 +462,9 @@ class BasicClient:
 
     async def on_data(self, data):
         """ Handle received data. """
-        self._receive_buffer += data
+        self._receive_buffer.extend(data)
 
-        while self._has_message():
-            message = self._parse_message()
+        for message in self._parse_messages():
             self.eventloop.create_task(self.on_raw(message))
 
     async def on_data_error(self, exception):
@@ -402,25 +480,34 @@ class BasicClient:
             self.logger.warning('Encountered strictly invalid IRC message from server: %s',
                                 message._raw)
 
-        if isinstance(message.command, int):
-            cmd = str(message.command).zfill(3)
+        command = message.command
+        if isinstance(command, int):
+            cmd = self._NUMERIC_COMMANDS[command] if 0 <= command < 1000 else str(command).zfill(3)
         else:
-            cmd = message.command
+            cmd = command
 
-        # Invoke dispatcher, if we have one.
-        method = 'on_raw_' + cmd.lower()
-        try:
+        # Look up dispatcher: a single dict probe on the hot path, falling back to a full
+        # attribute lookup only the first time a command is encountered.
+        entry = self._raw_dispatch.get(cmd)
+        if entry is None:
+            method = self._RAW_PREFIX + cmd.lower()
             # Set _top_level so __getattr__() can decide whether to return on_unknown or _ignored for unknown handlers.
             # The reason for this is that features can always call super().on_raw_* safely and thus don't need to care for other features,
             # while unknown messages for which no handlers exist at all are still logged.
             self._handler_top_level = True
             handler = getattr(self, method)
             self._handler_top_level = False
+            entry = self._raw_dispatch[cmd] = (handler, method)
 
+        handler, method = entry
+        try:
             await handler(message)
-        except:
+        except Exception:
             self.logger.exception('Failed to execute %s handler.', method)
 
+        # Dispatch is done: hand the message back to the pool so _parse_message() can reuse it.
+        self._message_pool.append(message)
+
     async def on_unknown(self, message):
         """ Unknown command. """
         self.logger.warning('Unknown command: [%s] %s %s', message.source, message.command,
@@ -433,7 +520,7 @@ class BasicClient:
     def __getattr__(self, attr):
         """ Return on_unknown or _ignored for unknown handlers, depending on the invocation type. """
         # Is this a raw handler?
-        if attr.startswith('on_raw_'):
+        if attr.startswith(self._RAW_PREFIX):
             # Are we in on_raw() trying to find any message handler?
             if self._handler_top_level:
                 # In that case, return the method that logs and possibly acts on unknown messages.
@@ -461,6 +548,10 @@ class BasicClient:
             raise AssertionError("Wrapped function {!r} must be an `async def` function.".format(func))
         setattr(self, func.__name__, functools.partial(func, self))
 
+        # Invalidate the dispatch cache in case this handler shadows a cached one.
+        if func.__name__.startswith(self._RAW_PREFIX):
+            self._raw_dispatch.clear()
+
         return func
 
 
@@ -480,6 +571,11 @@ class ClientPool:
         client.eventloop = self.eventloop
         # necessary to run multiple clients in the same thread via the pool
 
+        # If the pool is already running, connect the new client incrementally instead
+        # of requiring a full handle_forever() restart.
+        if self.eventloop.is_running():
+            asyncio.run_coroutine_threadsafe(client.connect(*args, **kwargs), self.eventloop)
+
     def disconnect(self, client):
         """ Remove client from pool. """
         self.clients.remove(client)
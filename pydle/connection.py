@@ -18,6 +18,7 @@ MESSAGE_THROTTLE_DELAY = 2
 class Connection:
     """ A TCP connection over the IRC protocol. """
     CONNECT_TIMEOUT = 10
+    RECEIVE_CHUNK_SIZE = 65536
 
     def __init__(self, hostname, port, tls=False, tls_verify=True, tls_certificate_file=None,
                  tls_certificate_keyfile=None, tls_certificate_password=None, ping_timeout=240,
@@ -112,4 +113,6 @@ class Connection:
         await self.writer.drain()
 
     async def recv(self, *, timeout=None):
-        return await asyncio.wait_for(self.reader.readline(), timeout=timeout)
+        # Read whatever is available in one go instead of scanning for a line
+        # terminator per read; the client buffers and splits lines itself.
+        return await asyncio.wait_for(self.reader.read(self.RECEIVE_CHUNK_SIZE), timeout=timeout)
@@ -15,13 +15,18 @@ class MonitoringSupport(isupport.ISUPPORTSupport):
     def _destroy_user(self, nickname, channel=None, monitor_override=False):
         # Override _destroy_user to not remove user if they are being monitored by us.
         if channel:
-            channels = [self.channels[channel]]
+            ch = self.channels.get(channel)
+            channels = [ch] if ch is not None else []
         else:
             channels = self.channels.values()
 
+        user = self.users.get(nickname)
         for ch in channels:
-            # Remove from nicklist.
-            ch['users'].discard(nickname)
+            # Remove from nicklist, keeping the membership count in sync.
+            if nickname in ch['users']:
+                ch['users'].discard(nickname)
+                if user is not None:
+                    user['_channels'] -= 1
 
             # Remove from statuses.
             for status in self._nickname_prefixes.values():
@@ -30,9 +35,26 @@ class MonitoringSupport(isupport.ISUPPORTSupport):
 
         # If we're not in any common channels with the user anymore, we have no reliable way to keep their info up-to-date.
         # Remove the user.
-        if (monitor_override or not self.is_monitoring(nickname)) and (not channel or not any(nickname in ch['users'] for ch in self.channels.values())):
+        if (monitor_override or not self.is_monitoring(nickname)) and (not channel or user is None or user['_channels'] <= 0):
             del self.users[nickname]
 
+    def _destroy_users(self, nicknames, channel):
+        ch = self.channels.get(channel)
+        if ch is None:
+            return
+
+        # Keep monitored users in the user database even when we lose the last common channel.
+        nicknames = list(nicknames)
+        monitored = {nickname for nickname in nicknames if self.is_monitoring(nickname)}
+        super()._destroy_users([nickname for nickname in nicknames if nickname not in monitored],
+                               channel)
+        for nickname in monitored:
+            if nickname in ch['users']:
+                ch['users'].discard(nickname)
+                user = self.users.get(nickname)
+                if user is not None:
+                    user['_channels'] -= 1
+
     ## API.
 
     async def monitor(self, target):
@@ -27,10 +27,10 @@ class TaggedMessage(rfc1459.RFC1459Message):
         self.__dict__.update(self._kw)
 
     @classmethod
-    def parse(cls, line, encoding=pydle.protocol.DEFAULT_ENCODING):
+    def parse(cls, line, encoding=pydle.protocol.DEFAULT_ENCODING, into=None):
         """
         Parse given line into IRC message structure.
-        Returns a TaggedMessage.
+        Returns a TaggedMessage, reusing `into` if given.
         """
         valid = True
         # Decode message.
@@ -86,6 +86,9 @@ class TaggedMessage(rfc1459.RFC1459Message):
 
         # Parse rest of message.
         message = super().parse(message.lstrip().encode(encoding), encoding=encoding)
+        if into is not None:
+            into.reset(_raw=raw, _valid=message._valid and valid, tags=tags, **message._kw)
+            return into
         return TaggedMessage(_raw=raw, _valid=message._valid and valid, tags=tags, **message._kw)
 
     def construct(self, force=False):
@@ -118,9 +121,7 @@ class TaggedMessageSupport(rfc1459.RFC1459Support):
         message = super()._create_message(command, *params, **kwargs)
         return TaggedMessage(tags=tags or {}, **message._kw)
 
-    def _parse_message(self):
-        sep = rfc1459.protocol.MINIMAL_LINE_SEPARATOR.encode(self.encoding)
-        message, _, data = self._receive_buffer.partition(sep)
-        self._receive_buffer = data
-
-        return TaggedMessage.parse(message + sep, encoding=self.encoding)
+    def _parse_line(self, line):
+        # Reuse a message from the pool, if available, instead of allocating a new one.
+        into = self._message_pool.pop() if self._message_pool else None
+        return TaggedMessage.parse(line, encoding=self.encoding, into=into)
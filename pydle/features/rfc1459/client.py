@@ -96,7 +96,8 @@ class RFC1459Support(BasicClient):
 
     def _destroy_user(self, user, channel=None):
         if channel:
-            channels = [self.channels[channel]]
+            ch = self.channels.get(channel)
+            channels = [ch] if ch is not None else []
         else:
             channels = self.channels.values()
 
@@ -236,9 +237,29 @@ class RFC1459Support(BasicClient):
 
     def _parse_message(self):
         sep = protocol.MINIMAL_LINE_SEPARATOR.encode(self.encoding)
-        message, _, data = self._receive_buffer.partition(sep)
-        self._receive_buffer = data
-        return parsing.RFC1459Message.parse(message + sep, encoding=self.encoding)
+        # Find the message boundary and consume the message from the buffer in place,
+        # so the remainder doesn't have to be copied into a fresh buffer.
+        end = self._receive_buffer.find(sep) + len(sep)
+        message = bytes(self._receive_buffer[:end])
+        del self._receive_buffer[:end]
+        return self._parse_line(message)
+
+    def _parse_messages(self):
+        # Split off every complete line in a single C-level pass instead of
+        # re-scanning the buffer per message.
+        sep = protocol.MINIMAL_LINE_SEPARATOR.encode(self.encoding)
+        lines = self._receive_buffer.split(sep)
+        tail = lines.pop()
+        del self._receive_buffer[:len(self._receive_buffer) - len(tail)]
+        for line in lines:
+            # Re-append the separator: the parser uses it to strip an optional \r.
+            yield self._parse_line(line + sep)
+
+    def _parse_line(self, line):
+        """ Parse a single raw message, without touching the receive buffer. """
+        # Reuse a message from the pool, if available, instead of allocating a new one.
+        into = self._message_pool.pop() if self._message_pool else None
+        return parsing.RFC1459Message.parse(line, encoding=self.encoding, into=into)
 
     ## IRC API.
 
@@ -573,7 +594,7 @@ class RFC1459Support(BasicClient):
             # Add user to channel user list.
             for channel in channels:
                 if self.in_channel(channel):
-                    self.channels[channel]['users'].add(nick)
+                    self._add_channel_user(channel, nick)
 
         for channel in channels:
             await self.on_join(channel, nick)
@@ -936,7 +957,7 @@ class RFC1459Support(BasicClient):
                     statuses.append(status)
 
             # Add user to user list.
-            self.channels[channel]['users'].add(nick)
+            self._add_channel_user(channel, nick)
             # And to channel modes..
             for status in statuses:
                 if status not in self.channels[channel]['modes']:
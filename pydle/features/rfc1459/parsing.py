@@ -1,6 +1,7 @@
 ## parsing.py
 # RFC1459 parsing and construction.
 import collections.abc
+import functools
 import pydle.protocol
 from . import protocol
 
@@ -15,11 +16,18 @@ class RFC1459Message(pydle.protocol.Message):
         self._raw = _raw
         self.__dict__.update(self._kw)
 
+    def reset(self, *args, **kwargs):
+        """ Re-initialize this message in place, so instances can be pooled and reused. """
+        # Drop attributes from the previous use before re-initializing.
+        for key in self._kw:
+            self.__dict__.pop(key, None)
+        self.__init__(*args, **kwargs)
+
     @classmethod
-    def parse(cls, line, encoding=pydle.protocol.DEFAULT_ENCODING):
+    def parse(cls, line, encoding=pydle.protocol.DEFAULT_ENCODING, into=None):
         """
         Parse given line into IRC message structure.
-        Returns a Message.
+        Returns a Message, reusing `into` if given.
         """
         valid = True
 
@@ -92,7 +100,10 @@ class RFC1459Message(pydle.protocol.Message):
         except ValueError:
             command = command.upper()
 
-        # Return parsed message.
+        # Return parsed message, reusing a pooled instance if we got one.
+        if into is not None:
+            into.reset(command, params, source=source, _valid=valid, _raw=message)
+            return into
         return RFC1459Message(command, params, source=source, _valid=valid, _raw=message)
 
     def construct(self, force=False):
@@ -132,8 +143,13 @@ class RFC1459Message(pydle.protocol.Message):
         return message
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize(input, case_mapping=protocol.DEFAULT_CASE_MAPPING):
-    """ Normalize input according to case mapping. """
+    """
+    Normalize input according to case mapping.
+    Cached: every user/channel lookup folds its key through here, so repeat
+    lookups of the same nickname become a single dict probe.
+    """
     if case_mapping not in protocol.CASE_MAPPINGS:
         raise pydle.protocol.ProtocolViolation('Unknown case mapping ({})'.format(case_mapping))
 